@@ -1,9 +1,33 @@
 import asyncio
 import aiohttp
+import codecs
+import collections
+import contextlib
 import logging
-import yaml
+import logging.handlers
 import os
 import itertools
+import json
+import orjson
+import queue
+import signal
+import time
+import urllib.parse
+
+# Accessibility texts are expected near the top of the page, so only its first 64 KiB is requested.
+RANGE_HEADERS = {'Range': 'bytes=0-65535'}
+
+# After a match, bodies up to this size are read to the end so the connection can be reused.
+MAX_DRAIN_BYTES = 65536
+
+# Alert payloads are serialized with orjson, so the content type is set explicitly.
+ALERT_HEADERS = {'Content-Type': 'application/json'}
+
+# Parsed config files keyed by path, each stored with the mtime it was parsed at.
+_CONFIG_CACHE = {}
+
+# Log records from every monitor go through this queue to the listener thread started by run().
+_LOG_QUEUE = queue.Queue(-1)
 
 class WebsiteMonitor:
     """Monitors the accessibility of websites and sends alerts if necessary."""
@@ -22,9 +46,86 @@ class WebsiteMonitor:
         """
         self.config_file = config_file
         self.load_config()
+        self._cond = None
+        self._inflight = 0
+        self._cmax = self.concurrent_requests
+        self._reload_tasks = set()
+        self._alert_tasks = set()
         self.logger = self.setup_logging()
         self.websites = self.load_websites_from_file()
 
+    @staticmethod
+    def _load_cached_config(config_file):
+        """
+        Parse the YAML config file, using a JSON cache next to it when it is up to date.
+
+        The cache records the modification time and size of the YAML file it was
+        built from and is only used while both match exactly, so replacing the
+        config with an older file still invalidates it. Failing to read or write
+        the cache is not an error; the YAML file is parsed instead.
+
+        Args:
+            config_file (str): Path to the configuration file (in YAML format).
+
+        Returns:
+            dict: The parsed configuration.
+
+        """
+        cache_file = f'{config_file}.cache.json'
+        stat = os.stat(config_file)
+
+        try:
+            with open(cache_file, 'r') as file:
+                cached = json.load(file)
+            if cached['mtime_ns'] == stat.st_mtime_ns and cached['size'] == stat.st_size:
+                return cached['config']
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+        # yaml is only imported when the JSON cache cannot be used.
+        import yaml
+        try:
+            from yaml import CSafeLoader as YamlLoader
+        except ImportError:
+            from yaml import SafeLoader as YamlLoader
+
+        with open(config_file, 'r') as file:
+            config = yaml.load(file, Loader=YamlLoader)
+
+        # Write to a temporary file first so a concurrent reader never sees a partial cache.
+        tmp_file = f'{cache_file}.{os.getpid()}.tmp'
+        try:
+            cached = json.dumps({'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'config': config})
+            with open(tmp_file, 'w') as file:
+                file.write(cached)
+            os.replace(tmp_file, cache_file)
+        except (OSError, TypeError, ValueError):
+            with contextlib.suppress(OSError):
+                os.remove(tmp_file)
+
+        return config
+
+    @staticmethod
+    def _parse(config_file):
+        """
+        Return the parsed config file, re-parsing only when it has been modified.
+
+        Args:
+            config_file (str): Path to the configuration file (in YAML format).
+
+        Returns:
+            dict: The parsed configuration.
+
+        """
+        mtime = os.stat(config_file).st_mtime_ns
+        cached = _CONFIG_CACHE.get(config_file)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        config = WebsiteMonitor._load_cached_config(config_file)
+        _CONFIG_CACHE[config_file] = (mtime, config)
+        return config
+
     def load_config(self):
         """
         Load configuration settings from the YAML config file.
@@ -35,19 +136,18 @@ class WebsiteMonitor:
 
         """
         try:
-            with open(self.config_file, 'r') as file:
-                config = yaml.safe_load(file)
-                self.webhook_url = config.get('webhook_url', '')
-                self.send_alerts = config.get('send_alerts', False)
-                self.retain_logs = config.get('retain_logs', True)
-                self.check_file_size = config.get('check_file_size', False)
-                max_file_size_mb = config.get('max_file_size_mb', 2048)  # Default: 2GB
-                self.max_file_size = max_file_size_mb * 1024 * 1024  # Convert MB to bytes
-                self.concurrent_requests = config.get('concurrent_requests', 10)  # Default: 10 concurrent requests
-                self.timeout = config.get('timeout', 10)  # Default: 10 seconds
-                self.global_accessibility_texts = config.get('global_accessibility_texts', [])
-                self.num_runs = config.get('num_runs', 1)
-                self.iteration_delay = config.get('iteration_delay', 0)
+            config = self._parse(self.config_file)
+            self.webhook_url = config.get('webhook_url', '')
+            self.send_alerts = config.get('send_alerts', False)
+            self.retain_logs = config.get('retain_logs', True)
+            self.check_file_size = config.get('check_file_size', False)
+            max_file_size_mb = config.get('max_file_size_mb', 2048)  # Default: 2GB
+            self.max_file_size = max_file_size_mb * 1024 * 1024  # Convert MB to bytes
+            self.concurrent_requests = config.get('concurrent_requests', 10)  # Default: 10 concurrent requests
+            self.timeout = config.get('timeout', 10)  # Default: 10 seconds
+            self.global_accessibility_texts = config.get('global_accessibility_texts', [])
+            self.num_runs = config.get('num_runs', 1)
+            self.iteration_delay = config.get('iteration_delay', 0)
         except FileNotFoundError:
             print(f'Config file "{self.config_file}" not found.')
             raise
@@ -63,29 +163,46 @@ class WebsiteMonitor:
             logging.Logger: The configured logger object.
 
         """
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(name)s - %(message)s',
-            filename='app.log',
-            filemode='a' if self.retain_logs else 'w'
+        # RotatingFileHandler always appends, so the log is truncated here when it should not be retained.
+        if not self.retain_logs:
+            open('app.log', 'w').close()
+
+        # With check_file_size, app.log is rotated so that it and its backups together
+        # stay within max_file_size.
+        backup_count = 3
+        file_handler = logging.handlers.RotatingFileHandler(
+            'app.log',
+            maxBytes=self.max_file_size // (backup_count + 1) if self.check_file_size else 0,
+            backupCount=backup_count,
+            delay=True
         )
-
-        logger = logging.getLogger(__name__.replace('__main__', ''))
+        file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(name)s - %(message)s'))
 
         console_handler = logging.StreamHandler()
         console_handler.setLevel(logging.WARNING)
         formatter = logging.Formatter('%(asctime)s - %(message)s')
         console_handler.setFormatter(formatter)
 
-        logger.addHandler(console_handler)
+        # Records are handed to a background thread so file writes never block the event loop.
+        # The queue handler is shared by every monitor, so it is only added to the root logger once.
+        root_logger = logging.getLogger()
+        root_logger.setLevel(logging.INFO)
+        if not any(isinstance(handler, logging.handlers.QueueHandler) and handler.queue is _LOG_QUEUE
+                   for handler in root_logger.handlers):
+            root_logger.addHandler(logging.handlers.QueueHandler(_LOG_QUEUE))
 
-        return logger
+        # The listener thread is started and stopped by run(); records logged before then wait in the queue.
+        self.log_listener = logging.handlers.QueueListener(
+            _LOG_QUEUE, file_handler, console_handler, respect_handler_level=True)
 
-    async def send_alert_to_rocketchat(self, website):
+        return logging.getLogger(__name__.replace('__main__', ''))
+
+    async def send_alert_to_rocketchat(self, session, website):
         """
         Send an alert to Rocket.Chat if send_alerts is enabled.
 
         Args:
+            session (aiohttp.ClientSession): Shared HTTP session.
             website (str): The website URL.
 
         """
@@ -96,16 +213,18 @@ class WebsiteMonitor:
         message = f'The website {website} is accessible over the internet.'
         payload = {'text': message}
 
-        async with aiohttp.ClientSession() as session:
-            try:
-                async with session.post(self.webhook_url, json=payload, timeout=self.timeout) as response:
-                    if response.status == 200:
-                        self.logger.info(f'Successfully sent alert to Rocket.Chat for {website}.')
-                    else:
-                        self.logger.error(
-                            f'Failed to send alert to Rocket.Chat for {website}. Status code: {response.status}')
-            except aiohttp.ClientError as e:
-                self.logger.error(f'Error occurred while sending alert to Rocket.Chat for {website}: {str(e)}')
+        try:
+            async with session.post(self.webhook_url, data=orjson.dumps(payload),
+                                    headers=ALERT_HEADERS) as response:
+                if response.status == 200:
+                    self.logger.info('Successfully sent alert to Rocket.Chat for %s.', website)
+                else:
+                    self.logger.error(
+                        'Failed to send alert to Rocket.Chat for %s. Status code: %s', website, response.status)
+        except asyncio.TimeoutError:
+            self.logger.error('Sending alert to Rocket.Chat for %s timed out.', website)
+        except aiohttp.ClientError as e:
+            self.logger.error('Error occurred while sending alert to Rocket.Chat for %s: %s', website, e)
 
     def load_websites_from_file(self):
         """
@@ -115,29 +234,44 @@ class WebsiteMonitor:
             dict: Dictionary of websites with their URLs as keys and their configurations as values.
 
         """
+        self._by_host = {}
         try:
-            with open(self.config_file, 'r') as file:
-                config = yaml.safe_load(file)
-                do_not_monitor = config.get('do_not_monitor', [])
-                monitor = config.get('monitor', [])
-
-                websites = {}
-
-                for website in do_not_monitor:
-                    websites[website['url']] = {'allowed': True}
-
-                for website in monitor:
-                    websites[website['url']] = {
-                        'allowed': False,
-                        'accessibility_texts': website.get('accessibility_texts', self.global_accessibility_texts)
-                    }
-
-                return websites
-        except FileNotFoundError:
-            self.logger.error(f'File "{self.config_file}" not found.')
+            config = self._parse(self.config_file)
+            do_not_monitor = config.get('do_not_monitor', [])
+            monitor = config.get('monitor', [])
+
+            websites = {}
+            global_texts_bytes = [text.encode('utf-8') for text in self.global_accessibility_texts]
+
+            for website in do_not_monitor:
+                websites[website['url']] = {'allowed': True}
+
+            for website in monitor:
+                texts = website.get('accessibility_texts', self.global_accessibility_texts)
+                websites[website['url']] = {
+                    'allowed': False,
+                    'accessibility_texts': texts,
+                    'accessibility_texts_bytes': global_texts_bytes if texts is self.global_accessibility_texts
+                    else [text.encode('utf-8') for text in texts]
+                }
+
+            # The allowed flag never changes after loading, so filter once here. Monitored
+            # websites are grouped by host so each host's checks can share a kept-alive connection.
+            by_host = collections.defaultdict(list)
+            for url, data in websites.items():
+                if not self.is_website_allowed(data):
+                    try:
+                        host = urllib.parse.urlsplit(url).netloc
+                    except ValueError:
+                        # Checked on its own, so the request logs the invalid URL like any other error.
+                        host = url
+                    by_host[host].append(url)
+
+            self._by_host = by_host
+            return websites
         except Exception as e:
             self.logger.error(
-                f'Error occurred while loading the websites from file "{self.config_file}": {str(e)}')
+                'Error occurred while loading the websites from file "%s": %s', self.config_file, e)
         return {}
 
     def is_website_allowed(self, website):
@@ -153,81 +287,324 @@ class WebsiteMonitor:
         """
         return website.get('allowed', True)
 
-    async def check_website_accessibility(self, sem, session, website):
+    def encode_accessibility_texts(self, website_data, charset):
+        """
+        Return the website's accessibility texts encoded for a response charset.
+
+        UTF-8 encodings are precomputed at load time; other charsets are encoded
+        on first use and cached on the website's data. A text that cannot be
+        represented in the charset, or an unknown charset, falls back to UTF-8.
+
+        Args:
+            website_data (dict): The website's configuration.
+            charset (str): The charset of the response, or None.
+
+        Returns:
+            list: The encoded accessibility texts.
+
+        """
+        try:
+            charset = codecs.lookup(charset or 'utf-8').name
+        except LookupError:
+            charset = 'utf-8'
+        if charset == 'utf-8':
+            return website_data['accessibility_texts_bytes']
+
+        by_charset = website_data.setdefault('accessibility_texts_by_charset', {})
+        if charset not in by_charset:
+            encoded = []
+            for text, text_bytes in zip(website_data['accessibility_texts'], website_data['accessibility_texts_bytes']):
+                try:
+                    encoded.append(text.encode(charset))
+                except UnicodeEncodeError:
+                    encoded.append(text_bytes)
+            by_charset[charset] = encoded
+        return by_charset[charset]
+
+    async def find_accessibility_text(self, response, texts_bytes):
+        """
+        Stream the response body and look for any of the accessibility texts.
+
+        The raw bytes are searched directly, so the body is never decoded. A
+        small tail of the previous chunk is kept, so texts split across chunk
+        boundaries are still found. Once a match is found, a partial (206)
+        response or one of at most MAX_DRAIN_BYTES is read to the end without
+        being searched, so the connection can go back to the pool. Otherwise,
+        such as when the server ignored the Range header, the connection is
+        closed so the rest of the body is not downloaded.
+
+        Args:
+            response (aiohttp.ClientResponse): The response to scan.
+            texts_bytes (list): Accessibility texts encoded in the response's charset.
+
+        Returns:
+            bool: True if any of the texts was found, False otherwise.
+
+        """
+        if not texts_bytes:
+            return False
+
+        overlap = max(len(text) for text in texts_bytes) - 1
+        window = bytearray()
+        async for chunk in response.content.iter_chunked(8192):
+            window += chunk
+            if any(text in window for text in texts_bytes):
+                if response.status == 206 or (response.content_length or MAX_DRAIN_BYTES + 1) <= MAX_DRAIN_BYTES:
+                    async for _ in response.content.iter_chunked(65536):
+                        pass
+                else:
+                    response.close()
+                return True
+            if overlap:
+                del window[:-overlap]
+            else:
+                window.clear()
+
+        return False
+
+    @contextlib.asynccontextmanager
+    async def request_slot(self):
+        """
+        Hold one of the concurrent request slots for the duration of the block.
+
+        Slots are tracked with a plain counter guarded by a condition, so the
+        limit can be changed at runtime with set_concurrent_requests.
+
+        """
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._inflight < self._cmax)
+            self._inflight += 1
+        try:
+            yield
+        finally:
+            async with self._cond:
+                self._inflight -= 1
+                self._cond.notify(1)
+
+    async def set_concurrent_requests(self, limit):
+        """
+        Change the number of concurrent requests while monitoring is running.
+
+        Args:
+            limit (int): The new maximum number of concurrent requests.
+
+        """
+        self.concurrent_requests = limit
+        async with self._cond:
+            self._cmax = limit
+            self._cond.notify_all()
+
+    async def reload_concurrent_requests(self):
+        """
+        Re-read concurrent_requests from the config file and apply it.
+
+        Called when the process receives SIGHUP. Values that are not positive
+        integers are rejected and the current limit is kept. Other settings
+        keep the values they had when monitoring started.
+
+        """
+        try:
+            limit = self._parse(self.config_file).get('concurrent_requests', 10)
+        except Exception as e:
+            self.logger.error('Error occurred while reloading the config from file "%s": %s', self.config_file, e)
+            return
+
+        if isinstance(limit, bool) or not isinstance(limit, int) or limit < 1:
+            self.logger.error('Ignoring invalid concurrent_requests %r from file "%s"; keeping %d.',
+                              limit, self.config_file, self._cmax)
+            return
+
+        await self.set_concurrent_requests(limit)
+        self.logger.info('Reloaded config: concurrent_requests=%d', limit)
+
+    async def check_website_accessibility(self, session, website):
         """
         Check the accessibility of a website asynchronously.
 
+        Concurrency is bounded by request_slot, which can be resized while
+        running. Websites without accessibility texts are checked with a HEAD
+        request, retried as a GET if the server does not support HEAD, any 2xx
+        or 3xx status counting as accessible. Otherwise only the start of the
+        page is requested.
+
+        Only alerts and errors are logged here; monitor_websites logs a single
+        summary per iteration from the returned results.
+
         Args:
-            sem (asyncio.Semaphore): Semaphore for limiting concurrent requests.
             session (aiohttp.ClientSession): HTTP session.
             website (str): The website URL to check.
 
         Returns:
-            bool: True if the website is accessible, False otherwise.
-
-        """
-        async with sem:  # Acquire the semaphore to limit concurrent requests
-            try:
-                async with session.get(website, timeout=self.timeout) as response:
-                    response_text = await response.text()
-                    website_data = self.websites[website]
-                    texts_to_check = website_data.get('accessibility_texts', self.global_accessibility_texts)
-                    if not any(text in response_text for text in texts_to_check):
-                        self.logger.warning(f'{website}: ALERT! Website is not accessible over the internet.')
-                        self.logger.info(f'{website}: Server returned status code {response.status}.')
-                        await self.send_alert_to_rocketchat(website)
-                        return True
-                    else:
-                        self.logger.info(f'{website}: accessible over the internet.')
-                        self.logger.info(f'{website}: Server returned status code {response.status}.')
-                        return False
-            except asyncio.TimeoutError:
-                self.logger.error(f'{website}: Request to {website} timed out.')
-            except aiohttp.ClientError as e:
-                self.logger.error(f'{website}: Error occurred during the request: {str(e)}')
-
-    async def monitor_websites(self, iteration):
+            tuple: (website, status_code, accessible, elapsed_seconds). status_code
+            and accessible are None if the request failed.
+
+        """
+        website_data = self.websites[website]
+        texts_bytes = website_data['accessibility_texts_bytes']
+        try:
+            async with self.request_slot():
+                # Timed from here so that waiting for a slot does not count as request latency.
+                start = time.monotonic()
+                if not texts_bytes:
+                    # Without accessibility texts only reachability matters, so skip the body.
+                    async with session.head(website) as response:
+                        status = response.status
+                    if status in (405, 501):
+                        # Some servers do not implement HEAD, so ask for the start of the page instead.
+                        async with session.get(website, headers=RANGE_HEADERS) as response:
+                            status = response.status
+                    found = 200 <= status < 400
+                else:
+                    async with session.get(website, headers=RANGE_HEADERS) as response:
+                        texts_bytes = self.encode_accessibility_texts(website_data, response.charset)
+                        found = await self.find_accessibility_text(response, texts_bytes)
+                        status = response.status
+        except asyncio.TimeoutError:
+            self.logger.error('%s: Request to %s timed out.', website, website)
+            return website, None, None, time.monotonic() - start
+        except aiohttp.ClientError as e:
+            self.logger.error('%s: Error occurred during the request: %s', website, e)
+            return website, None, None, time.monotonic() - start
+        elapsed = time.monotonic() - start
+
+        if not found:
+            self.logger.warning('%s: ALERT! Website is not accessible over the internet. Status code: %s.',
+                                website, status)
+            if self.send_alerts:
+                # Alerts run in the background so they never hold up the remaining checks.
+                task = asyncio.create_task(self.send_alert_to_rocketchat(session, website))
+                self._alert_tasks.add(task)
+                task.add_done_callback(self.on_alert_done)
+        return website, status, found, elapsed
+
+    def on_alert_done(self, task):
+        """
+        Log any unexpected error from a finished alert task and stop tracking it.
+
+        Args:
+            task (asyncio.Task): The finished send_alert_to_rocketchat task.
+
+        """
+        self._alert_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            self.logger.error('Error occurred while sending an alert to Rocket.Chat: %r', task.exception())
+
+    async def check_host(self, session, websites):
+        """
+        Check the websites of a single host one after another.
+
+        Running them serially lets every check reuse the same kept-alive
+        connection instead of opening one per website.
+
+        Args:
+            session (aiohttp.ClientSession): HTTP session.
+            websites (list): URLs of the websites on this host.
+
+        Returns:
+            list: The results of check_website_accessibility for each website.
+
+        """
+        return [await self.check_website_accessibility(session, website) for website in websites]
+
+    async def monitor_websites(self, iteration, session):
         """
         Monitor the websites for accessibility and send alerts if necessary.
 
         Args:
             iteration (int): The current iteration number.
+            session (aiohttp.ClientSession): Shared HTTP session, reused across iterations.
 
         """
-        sem = asyncio.Semaphore(self.concurrent_requests)
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(self.check_host(session, host_websites))
+                     for host_websites in self._by_host.values()]
+
+        results = [result for task in tasks for result in task.result()]
+        accessible = sum(1 for _, _, ok, _ in results if ok)
+        alerts = sum(1 for _, _, ok, _ in results if ok is False)
+        avg_ms = sum(elapsed for _, _, _, elapsed in results) * 1000 / len(results) if results else 0.0
+        self.logger.info('iteration=%d accessible=%d alerts=%d errors=%d total=%d avg_ms=%.1f',
+                         iteration + 1, accessible, alerts, len(results) - accessible - alerts,
+                         len(results), avg_ms)
 
-        async with aiohttp.ClientSession() as session:
-            tasks = []
-            for website_url, website_data in self.websites.items():
-                if not self.is_website_allowed(website_data):
-                    task = asyncio.ensure_future(self.check_website_accessibility(sem, session, website_url))
-                    tasks.append(task)
-
-            if tasks:
-                await asyncio.gather(*tasks)
-        
         if self.num_runs != -1 and iteration < self.num_runs - 1:
             print(f'Iteration {iteration + 1}/{self.num_runs} completed. Delaying for {self.iteration_delay} seconds.')
         elif self.num_runs == -1 or iteration < self.num_runs - 1:
             print(f'Iteration {iteration + 1} completed. Delaying for {self.iteration_delay} seconds.')
 
+    def create_connector(self):
+        """
+        Create the TCP connector shared by every request of the monitor.
+
+        The pool itself is not limited in size, since request_slot already
+        caps the number of concurrent checks and can be resized at runtime.
+        DNS lookups are cached for the lifetime of the connector. If aiodns is
+        installed, lookups are also done without blocking the event loop. There
+        is no per-host limit: check_host already checks a host's websites one
+        after another, and a burst of alerts must not queue behind two
+        connections to the webhook host.
+
+        Returns:
+            aiohttp.TCPConnector: The configured connector.
+
+        """
+        try:
+            import aiodns  # noqa: F401
+            resolver = aiohttp.AsyncResolver()
+        except ImportError:
+            resolver = None
+
+        return aiohttp.TCPConnector(
+            limit=0,
+            use_dns_cache=True,
+            ttl_dns_cache=300,
+            keepalive_timeout=30,
+            resolver=resolver
+        )
+
+    def on_reload_signal(self):
+        """Schedule reload_concurrent_requests from the SIGHUP handler."""
+        task = asyncio.create_task(self.reload_concurrent_requests())
+        self._reload_tasks.add(task)
+        task.add_done_callback(self._reload_tasks.discard)
+
     async def run_monitoring(self):
-        for iteration in range(self.num_runs) if self.num_runs != -1 else itertools.count():
-            await self.monitor_websites(iteration)
-            if self.iteration_delay > 0:
-                await asyncio.sleep(self.iteration_delay)
-                if self.num_runs != -1 and iteration < self.num_runs - 1:
-                    print(f'Delay of {self.iteration_delay} seconds completed. Starting the next iteration.')
-                elif self.num_runs != -1 and iteration == self.num_runs - 1:
-                    print('Last iteration completed.')
+        self._cond = asyncio.Condition()
+        # SIGHUP applies a changed concurrent_requests without restarting. Not available on Windows.
+        loop = asyncio.get_running_loop()
+        with contextlib.suppress(AttributeError, NotImplementedError, RuntimeError):
+            loop.add_signal_handler(signal.SIGHUP, self.on_reload_signal)
+        connector = self.create_connector()
+        # Timeouts are set once on the session rather than on every request.
+        timeout = aiohttp.ClientTimeout(total=self.timeout, connect=min(5, self.timeout), sock_read=self.timeout)
+        # A single session keeps connections and resolved hosts alive across
+        # iterations and alerts.
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+            for iteration in range(self.num_runs) if self.num_runs != -1 else itertools.count():
+                await self.monitor_websites(iteration, session)
+                if self.iteration_delay > 0:
+                    await asyncio.sleep(self.iteration_delay)
+                    if self.num_runs != -1 and iteration < self.num_runs - 1:
+                        print(f'Delay of {self.iteration_delay} seconds completed. Starting the next iteration.')
+                    elif self.num_runs != -1 and iteration == self.num_runs - 1:
+                        print('Last iteration completed.')
+            # Errors from these tasks are logged by on_alert_done.
+            await asyncio.gather(*self._alert_tasks, return_exceptions=True)
 
     def run(self):
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self.run_monitoring())
-        if self.check_file_size:
-            log_file = 'app.log'
-            if os.path.isfile(log_file) and os.path.getsize(log_file) > self.max_file_size:
-                os.remove(log_file)
+        # uvloop is used for this run only, without changing the global event loop policy.
+        try:
+            import uvloop
+            loop_factory = uvloop.new_event_loop
+        except ImportError:
+            loop_factory = None
+
+        self.log_listener.start()
+        try:
+            with asyncio.Runner(loop_factory=loop_factory) as runner:
+                runner.run(self.run_monitoring())
+        finally:
+            self.log_listener.stop()
 
 if __name__ == '__main__':
     config_file = 'config.yaml'